@@ -2,8 +2,8 @@ from __future__ import annotations
 
 import weakref
 from functools import partial
-from types import BuiltinMethodType, MethodType
-from typing import TYPE_CHECKING, Any, Callable, Generic, Protocol, TypeVar, cast
+from types import BuiltinMethodType, FunctionType, MethodType
+from typing import TYPE_CHECKING, Any, Callable, Generic, Protocol, TypeVar
 
 if TYPE_CHECKING:
     from typing_extensions import TypeGuard
@@ -11,6 +11,9 @@ if TYPE_CHECKING:
 T = TypeVar("T")
 R = TypeVar("R")
 _LAMBDA_NAME = "<lambda>"  # (lambda: None).__name__ won't compile with mypyc
+# module-level alias: saves an attribute lookup on `weakref` for every reference
+# created (`weakref.ref` is the same object as `weakref.ReferenceType`)
+_ref = weakref.ref
 
 
 class BoundMethodType(Protocol[R]):
@@ -66,8 +69,24 @@ class WeakCallable(Generic[R]):
     call time, while others don't.
     """
 
+    __slots__ = ("_obj_ref", "_args_slice", "_hash")
+
     _obj_ref: weakref.ReferenceType[Any]
-    _max_args: int | None = None
+    # `slice(None)` when there is no max_args. Slicing a tuple with it returns
+    # the same tuple, so callbacks can always slice without branching.
+    _args_slice: slice
+    # computed once in __init__ from the ids of the referents, so that the hash
+    # remains stable after the referents are deleted.  `__eq__` compares it first:
+    # it's a cheap int comparison that rejects most non-matching callers, and it
+    # ensures that callers to distinct (but `==`) objects are never equal.
+    _hash: int
+    # callers that accept objects that can't be weakly referenced set _obj_ref to
+    # None and hold the object in _strong instead (see `_deref`)
+    _strong: Any
+
+    @property
+    def _max_args(self) -> int | None:
+        return self._args_slice.stop  # type: ignore[no-any-return]
 
     def callback(self, args: tuple[Any, ...] = ()) -> bool:
         """Call the referenced function. Return True if weakref is dead.
@@ -76,12 +95,9 @@ class WeakCallable(Generic[R]):
         """
         raise NotImplementedError()
 
-    def _prune_args(self, args: tuple) -> tuple[Any, ...]:
-        return args[: self._max_args] if self._max_args is not None else args
-
     def __call__(self, *args: Any, **kwargs: Any) -> R:
         """Call the referenced function.  Raise a RuntimeError if it is dead."""
-        return self.slot()(*self._prune_args(args))
+        return self.slot()(*args[self._args_slice])
 
     def __eq__(self, other: object) -> bool:
         """Return True if `other` is equal to this WeakCaller."""
@@ -93,7 +109,12 @@ class WeakCallable(Generic[R]):
 
     def is_alive(self) -> bool:
         """Return True if the slot is still alive."""
-        return self._obj_ref() is not None
+        return self._deref() is not None
+
+    def _deref(self) -> Any:
+        """Return the referenced object, or `None` if it has been deleted."""
+        ref = self._obj_ref
+        return self._strong if ref is None else ref()
 
     @classmethod
     def create(
@@ -102,23 +123,27 @@ class WeakCallable(Generic[R]):
         """Return a `WeakCaller` appropriate for `func`."""
         if isinstance(func, WeakCallable):
             return func
-        if _is_partial_method(func):
-            return _PartialMethodCaller(func, max_args)
 
-        slot_name = getattr(func, "__name__", None)
-        if key is not None and slot_name is not None:
-            for method, caller_cls in (
-                ("__setattr__", _SetattrCaller),
-                ("__setitem__", _SetitemCaller),
-            ):
-                if method == slot_name:
-                    if not hasattr(func, "__self__"):  # pragma: no cover
-                        raise TypeError(
-                            f"Cannot use {method} as a weak callback unless it is a "
-                            "bound method."
-                        )
-                    return caller_cls(func.__self__, key, max_args)
+        if key is not None:
+            slot_name = getattr(func, "__name__", None)
+            if slot_name == "__setattr__" or slot_name == "__setitem__":
+                if not hasattr(func, "__self__"):  # pragma: no cover
+                    raise TypeError(
+                        f"Cannot use {slot_name} as a weak callback unless it is a "
+                        "bound method."
+                    )
+                obj = func.__self__
+                if slot_name == "__setattr__":
+                    return _SetattrCaller(obj, key, max_args)
+                return _SetitemCaller(obj, key, max_args)
+
+        # fast path: exact type lookup for the most common callables
+        caller_cls = _CALLER_TYPES.get(type(func))
+        if caller_cls is not None:
+            return caller_cls(func, max_args)
 
+        if _is_partial_method(func):
+            return _PartialMethodCaller(func, max_args)
         if isinstance(func, MethodType):
             return _BoundMethodCaller(func, max_args)
         elif isinstance(func, BuiltinMethodType):
@@ -138,13 +163,17 @@ class _FunctionCaller(WeakCallable):
     it from being garbage collected.
     """
 
+    __slots__ = ("_func", "_strong")
+
     def __init__(self, func: Callable[..., R], max_args: int | None = None) -> None:
         try:
-            self._obj_ref: weakref.ReferenceType[Callable[..., R]] = weakref.ref(func)
+            self._obj_ref: weakref.ReferenceType[Callable[..., R]] = _ref(func)
+            self._strong = None
         except TypeError:
             # func is not weakrefable, so we just store it
             # TODO: warn?
-            self._obj_ref = lambda: func  # type: ignore[assignment]
+            self._obj_ref = None  # type: ignore[assignment]
+            self._strong = func
         qname = getattr(func, "__qualname__", "")
         if (
             getattr(func, "__name__", None) == _LAMBDA_NAME
@@ -155,20 +184,30 @@ class _FunctionCaller(WeakCallable):
             # store a reference to the function for lambda functions, and for
             # pyqtBoundSignal.emit
             self._func = func
-        self._max_args = max_args
+        self._args_slice = slice(max_args)
+        self._hash = hash(id(func))
 
     def callback(self, args: tuple[Any, ...] = ()) -> bool:
-        func = self._obj_ref()
+        ref = self._obj_ref
+        func = self._strong if ref is None else ref()
         if func is None:
             return True
-        func(*self._prune_args(args))
+        func(*args[self._args_slice])
         return False
 
     def __eq__(self, other: object) -> bool:
-        return isinstance(other, _FunctionCaller) and self._obj_ref == other._obj_ref
+        return (
+            type(other) is _FunctionCaller
+            and self._hash == other._hash
+            and self._obj_ref == other._obj_ref
+            and self._strong is other._strong
+        )
+
+    def __hash__(self) -> int:
+        return self._hash
 
     def slot(self) -> Callable[..., R]:
-        func = self._obj_ref()
+        func: Callable[..., R] | None = self._deref()
         if func is None:
             raise RuntimeError("function has been deleted")
         return func
@@ -177,6 +216,8 @@ class _FunctionCaller(WeakCallable):
 class _BoundMethodCaller(WeakCallable):
     """Caller of a (dereferenced) bound method."""
 
+    __slots__ = ("_func_ref", "_method_type")
+
     def __init__(self, method: BoundMethodType[R], max_args: int | None = None) -> None:
         try:
             obj = method.__self__
@@ -186,28 +227,36 @@ class _BoundMethodCaller(WeakCallable):
                 f"argument should be a bound method, not {type(method)}"
             ) from None
 
-        self._obj_ref = weakref.ref(obj)
-        self._func_ref: weakref.ReferenceType[Callable[..., R]] = weakref.ref(func)
-        self._method_type = cast(
-            Callable[[Callable[..., R], Any], BoundMethodType[R]], type(method)
+        self._obj_ref = _ref(obj)
+        self._func_ref: weakref.ReferenceType[Callable[..., R]] = _ref(func)
+        # only store the method type if it's something unusual (it's almost always
+        # types.MethodType, which `_method` falls back to)
+        method_type: type = type(method)
+        self._method_type: Callable[..., BoundMethodType[R]] | None = (
+            None if method_type is MethodType else method_type
         )
-        self._max_args = max_args
+        self._args_slice = slice(max_args)
+        self._hash = hash((id(obj), id(func)))
 
     def callback(self, args: tuple[Any, ...] = ()) -> bool:
         obj = self._obj_ref()
         func = self._func_ref()
         if obj is None or func is None:
             return True
-        func(obj, *self._prune_args(args))  # faster than self._method()(*args)
+        func(obj, *args[self._args_slice])  # faster than self._method()(*args)
         return False
 
     def __eq__(self, other: object) -> bool:
         return (
-            isinstance(other, _BoundMethodCaller)
+            type(other) is _BoundMethodCaller
+            and self._hash == other._hash
             and self._obj_ref == other._obj_ref
             and self._func_ref == other._func_ref
         )
 
+    def __hash__(self) -> int:
+        return self._hash
+
     def _method(self) -> BoundMethodType[R] | None:
         """Reconstruct the original method.
 
@@ -218,7 +267,7 @@ class _BoundMethodCaller(WeakCallable):
         func = self._func_ref()
         if obj is None or func is None:
             return None
-        return self._method_type(func, obj)
+        return (self._method_type or MethodType)(func, obj)
 
     def slot(self) -> BoundMethodType[R]:
         """Return original method or raise RuntimeError if it has been deleted."""
@@ -235,6 +284,8 @@ class _BuiltinMethodCaller(WeakCallable[R]):
     separately.
     """
 
+    __slots__ = ("_func_name", "_strong")
+
     def __init__(self, method: BuiltinMethodType, max_args: int | None = None) -> None:
         try:
             obj = method.__self__
@@ -245,39 +296,48 @@ class _BuiltinMethodCaller(WeakCallable[R]):
             ) from None
 
         try:
-            self._obj_ref = weakref.ref(obj)
+            self._obj_ref = _ref(obj)
+            self._strong = None
         except TypeError:
             # obj is not weakrefable, so we just store it
             # TODO: warn?
-            self._obj_ref = lambda: obj  # type: ignore[assignment]
+            self._obj_ref = None  # type: ignore[assignment]
+            self._strong = obj
         self._func_name = func_name
-        self._max_args = max_args
+        self._args_slice = slice(max_args)
+        self._hash = hash((id(obj), func_name))
 
     def callback(self, args: tuple[Any, ...] = ()) -> bool:
-        obj = self._obj_ref()
+        ref = self._obj_ref
+        obj = self._strong if ref is None else ref()
         if obj is None:
             return True
         func = getattr(obj, self._func_name)
-        func(*self._prune_args(args))  # faster than self._method()(*args)
+        func(*args[self._args_slice])  # faster than self._method()(*args)
         return False
 
     def __eq__(self, other: object) -> bool:
         return (
-            isinstance(other, _BuiltinMethodCaller)
+            type(other) is _BuiltinMethodCaller
+            and self._hash == other._hash
             and self._obj_ref == other._obj_ref
+            and self._strong is other._strong
             and self._func_name == other._func_name
         )
 
+    def __hash__(self) -> int:
+        return self._hash
+
     def _method(self) -> Callable[..., R] | None:
         """Reconstruct the original method.
 
         Note: this isn't used above in __call__ because it's a bit slower
         """
         # sourcery skip: assign-if-exp, reintroduce-else
-        obj = self._obj_ref()
+        obj = self._deref()
         if obj is None:
             return None
-        return cast("Callable[..., R]", getattr(obj, self._func_name))
+        return getattr(obj, self._func_name)  # type: ignore[no-any-return]
 
     def slot(self) -> Callable[..., R]:
         """Return original method or raise RuntimeError if it has been deleted."""
@@ -290,6 +350,8 @@ class _BuiltinMethodCaller(WeakCallable[R]):
 class _PartialMethodCaller(WeakCallable):
     """Caller of a partial to a (dereferenced) bound method."""
 
+    __slots__ = ("_func_ref", "_method_type", "_partial_args", "_partial_kwargs")
+
     def __init__(self, part: PartialMethod[R], max_args: int | None = None) -> None:
         method = part.func
         try:
@@ -300,12 +362,16 @@ class _PartialMethodCaller(WeakCallable):
                 f"argument should be a bound method, not {type(method)}"
             ) from None
 
-        self._obj_ref = weakref.ref(obj)
-        self._func_ref: weakref.ReferenceType[Callable[..., R]] = weakref.ref(func)
-        self._method_type = cast(
-            Callable[[Callable[..., R], Any], BoundMethodType[R]], type(method)
+        self._obj_ref = _ref(obj)
+        self._func_ref: weakref.ReferenceType[Callable[..., R]] = _ref(func)
+        # only store the method type if it's something unusual (it's almost always
+        # types.MethodType, which `_method` falls back to)
+        method_type: type = type(method)
+        self._method_type: Callable[..., BoundMethodType[R]] | None = (
+            None if method_type is MethodType else method_type
         )
-        self._max_args = max_args
+        self._args_slice = slice(max_args)
+        self._hash = hash((id(obj), id(func)))
         self._partial_args = part.args
         self._partial_kwargs = part.keywords
 
@@ -314,16 +380,21 @@ class _PartialMethodCaller(WeakCallable):
         func = self._func_ref()
         if obj is None or func is None:
             return True
-        func(obj, *self._partial_args, *self._prune_args(args), **self._partial_kwargs)
+        args = args[self._args_slice]
+        func(obj, *self._partial_args, *args, **self._partial_kwargs)
         return False
 
     def __eq__(self, other: object) -> bool:
         return (
-            isinstance(other, _PartialMethodCaller)
+            type(other) is _PartialMethodCaller
+            and self._hash == other._hash
             and self._obj_ref == other._obj_ref
             and self._func_ref == other._func_ref
         )
 
+    def __hash__(self) -> int:
+        return self._hash
+
     def _method(self) -> BoundMethodType[R] | None:
         """Reconstruct the original method.
 
@@ -334,43 +405,53 @@ class _PartialMethodCaller(WeakCallable):
         func = self._func_ref()
         if obj is None or func is None:
             return None
-        return self._method_type(func, obj)
+        return (self._method_type or MethodType)(func, obj)
 
     def slot(self) -> PartialMethod[R]:
         method: BoundMethodType[R] | None = self._method()
         if method is None:
             raise RuntimeError("object has been deleted")  # pragma: no cover
         _partial = partial(method, *self._partial_args, **self._partial_kwargs)
-        return cast("PartialMethod[R]", _partial)
+        return _partial  # type: ignore[return-value]
 
 
 class _SetattrCaller(WeakCallable):
     """Caller to set an attribute on an object."""
 
+    __slots__ = ("_key",)
+
     def __init__(
         self, obj: weakref.ReferenceType | Any, attr: str, max_args: int | None = None
     ) -> None:
-        self._obj_ref = (
-            obj if isinstance(obj, weakref.ReferenceType) else weakref.ref(obj)
-        )
+        self._obj_ref = obj if isinstance(obj, _ref) else _ref(obj)
         self._key = attr
-        self._max_args = max_args
+        self._args_slice = slice(max_args)
+        self._hash = hash((id(self._obj_ref()), attr))
 
     def callback(self, args: tuple[Any, ...] = ()) -> bool:
         obj = self._obj_ref()
         if obj is None:
             return True
-        args = self._prune_args(args)
-        setattr(obj, self._key, args[0] if len(args) == 1 else args)
+        # a single value is by far the most common case, so unpack it directly
+        # rather than checking len(args) on every call
+        try:
+            (value,) = args[self._args_slice]
+        except ValueError:
+            value = args[self._args_slice]
+        setattr(obj, self._key, value)
         return False
 
     def __eq__(self, other: object) -> bool:
         return (
-            isinstance(other, _SetattrCaller)
+            type(other) is _SetattrCaller
+            and self._hash == other._hash
             and self._obj_ref == other._obj_ref
             and self._key == other._key
         )
 
+    def __hash__(self) -> int:
+        return self._hash
+
     def slot(self) -> Callable:
         obj = self._obj_ref()
         if obj is None:
@@ -381,30 +462,41 @@ class _SetattrCaller(WeakCallable):
 class _SetitemCaller(WeakCallable):
     """Caller to call __setitem__ on an object."""
 
+    __slots__ = ("_key",)
+
     def __init__(
         self, obj: weakref.ReferenceType | Any, key: Any, max_args: int | None = None
     ) -> None:
-        self._obj_ref = (
-            obj if isinstance(obj, weakref.ReferenceType) else weakref.ref(obj)
-        )
-        self._max_args = max_args
+        self._obj_ref = obj if isinstance(obj, _ref) else _ref(obj)
+        self._args_slice = slice(max_args)
+        # `key` may not be hashable
+        self._hash = hash(id(self._obj_ref()))
         self._key = key
 
     def callback(self, args: tuple[Any, ...] = ()) -> bool:
         obj = self._obj_ref()
         if obj is None:
             return True
-        args = self._prune_args(args)
-        obj[self._key] = args[0] if len(args) == 1 else args
+        # a single value is by far the most common case, so unpack it directly
+        # rather than checking len(args) on every call
+        try:
+            (value,) = args[self._args_slice]
+        except ValueError:
+            value = args[self._args_slice]
+        obj[self._key] = value
         return False
 
     def __eq__(self, other: object) -> bool:
         return (
-            isinstance(other, _SetitemCaller)
+            type(other) is _SetitemCaller
+            and self._hash == other._hash
             and self._obj_ref == other._obj_ref
             and self._key == other._key
         )
 
+    def __hash__(self) -> int:
+        return self._hash
+
     def slot(self) -> Callable:
         obj = self._obj_ref()
         if obj is None:
@@ -412,101 +504,192 @@ class _SetitemCaller(WeakCallable):
         return partial(obj.__setitem__, self._key)
 
 
-def _try_ref(obj: T) -> Callable[[], T | None] | None:
+_CALLER_TYPES: dict[type, Callable[..., WeakCallable]] = {
+    FunctionType: _FunctionCaller,
+    MethodType: _BoundMethodCaller,
+    BuiltinMethodType: _BuiltinMethodCaller,
+}
+
+
+def _try_ref(obj: T) -> weakref.ReferenceType[T] | None:
+    """Return a weakref to `obj`, or None if `obj` should be stored directly."""
     if obj is None:
         return None
     try:
-        return weakref.ref(obj)
+        return _ref(obj)
     except TypeError:
-        return lambda: obj
+        return None
 
 
 class weak_partial(WeakCallable[R]):
-    def __init__(self, func: Callable[..., R], *args: Any, **kwargs: Any) -> None:
-        if not callable(func):
-            raise TypeError("the first argument must be callable")
+    __slots__ = (
+        "_self_ref",
+        "_arg_template",
+        "_live_arg_idx",
+        "_live_arg_refs",
+        "_kwarg_template",
+        "_live_kwarg_keys",
+        "_live_kwarg_refs",
+    )
 
+    def __init__(self, func: Callable[..., R], *args: Any, **kwargs: Any) -> None:
         if isinstance(func, partial):
             args = func.args + args
             kwargs = {**func.keywords, **kwargs}
             func = func.func
+        if not callable(func):
+            raise TypeError("the first argument must be callable")
 
-        self._self_ref: weakref.ReferenceType[Any] | None = None
-        self._method_type: Callable[..., Callable[..., R]] | None = None
-        if isinstance(func, MethodType):
-            self._method_type = type(func)
-            self._self_ref = weakref.ref(func.__self__)
-            self._obj_ref = weakref.ref(func.__func__)
+        # MethodType can't be subclassed, so unlike the other callers we never
+        # need to store the method type: a non-None _self_ref means bound method.
+        self._self_ref: weakref.ReferenceType[Any] | None
+        if type(func) is MethodType:
+            self._self_ref = _ref(func.__self__)
+            self._obj_ref = _ref(func.__func__)
         else:
-            self._obj_ref = weakref.ref(func)
-        self._args = tuple(_try_ref(arg) for arg in args)
-        self._kwargs = {k: _try_ref(v) for k, v in kwargs.items()}
+            self._self_ref = None
+            self._obj_ref = _ref(func)
+        self._args_slice = slice(None)
+
+        # args and kwargs are stored as a "template" holding everything that
+        # can't be weakly referenced (with None in place of the weakrefable
+        # items), plus the positions/keys and weakrefs of the weakrefable ones.
+        arg_template = list(args)
+        arg_idx: list[int] = []
+        arg_refs: list[weakref.ReferenceType] = []
+        for i, arg in enumerate(args):
+            ref = _try_ref(arg)
+            if ref is not None:
+                arg_template[i] = None
+                arg_idx.append(i)
+                arg_refs.append(ref)
+        self._arg_template = tuple(arg_template)
+        self._live_arg_idx = tuple(arg_idx)
+        self._live_arg_refs = tuple(arg_refs)
+
+        kwarg_template = dict(kwargs)
+        kwarg_keys: list[str] = []
+        kwarg_refs: list[weakref.ReferenceType] = []
+        for k, v in kwargs.items():
+            ref = _try_ref(v)
+            if ref is not None:
+                kwarg_template[k] = None
+                kwarg_keys.append(k)
+                kwarg_refs.append(ref)
+        self._kwarg_template = kwarg_template
+        self._live_kwarg_keys = tuple(kwarg_keys)
+        self._live_kwarg_refs = tuple(kwarg_refs)
 
     @property
     def func(self) -> Callable[..., R] | None:
         func = self._obj_ref()
         if func is None:
             return None
-        if self._method_type is not None:
-            obj = cast("weakref.ReferenceType[Any]", self._self_ref)()
-            return None if obj is None else self._method_type(func, obj)
+        if self._self_ref is not None:
+            obj = self._self_ref()
+            return None if obj is None else MethodType(func, obj)
         return self._obj_ref()
 
     @property
     def args(self) -> tuple[Any, ...]:
-        args = []
-        for arg in self._args:
-            if arg is not None:
-                _arg = arg()
-                if _arg is None:
-                    raise RuntimeError("object in args has been deleted")
-            else:
-                _arg = None
-            args.append(_arg)
+        # slow path: `callback` resolves these inline
+        if not self._live_arg_refs:
+            return self._arg_template
+        args = list(self._arg_template)
+        for i, ref in zip(self._live_arg_idx, self._live_arg_refs):
+            arg = ref()
+            if arg is None:
+                raise RuntimeError("object in args has been deleted")
+            args[i] = arg
         return tuple(args)
 
     @property
     def keywords(self) -> dict[str, Any]:
-        kwargs = {}
-        for k, v in self._kwargs.items():
-            if v is not None:
-                _v = v()
-                if _v is None:
-                    raise RuntimeError("object in kwargs has been deleted")
-            else:
-                _v = None
-            kwargs[k] = _v
+        # slow path: `callback` resolves these inline
+        kwargs = self._kwarg_template.copy()
+        for k, ref in zip(self._live_kwarg_keys, self._live_kwarg_refs):
+            v = ref()
+            if v is None:
+                raise RuntimeError("object in kwargs has been deleted")
+            kwargs[k] = v
         return kwargs
 
     def callback(self, args: tuple[Any, ...] = ()) -> bool:
         func = self._obj_ref()
         if func is None:
             return True
-        try:
-            args = self.args + args
-            kwargs = self.keywords
-        except RuntimeError:
-            return True
 
-        if self._method_type is not None:
+        # this inlines self.args and self.keywords, which are slower.
+        # When nothing was weakly referenced, the templates are used as-is.
+        p_args: list[Any] | tuple[Any, ...] = self._arg_template
+        if self._live_arg_refs:
+            p_args = list(p_args)
+            for i, ref in zip(self._live_arg_idx, self._live_arg_refs):
+                arg = ref()
+                if arg is None:
+                    return True
+                p_args[i] = arg
+        kwargs = self._kwarg_template
+        if self._live_kwarg_refs:
+            kwargs = kwargs.copy()
+            for k, ref in zip(self._live_kwarg_keys, self._live_kwarg_refs):
+                v = ref()
+                if v is None:
+                    return True
+                kwargs[k] = v
+
+        if self._self_ref is not None:
             # bound method
-            obj = cast("weakref.ReferenceType[Any]", self._self_ref)()
+            obj = self._self_ref()
             if obj is None:
                 return True
-            args = (obj, *args)
-
-        func(*args, **kwargs)
+            func(obj, *p_args, *args, **kwargs)
+        else:
+            func(*p_args, *args, **kwargs)
         return False
 
     def __call__(self, *args: Any, **kwargs: Any) -> R:
         func = self.func
         if func is None:
             raise RuntimeError("object has been deleted")
-        return func(*self.args, *args, **{**self.keywords, **kwargs})
+        # the template is never mutated below, so it's safe to use directly
+        keywords = self.keywords if self._live_kwarg_refs else self._kwarg_template
+        if kwargs:
+            if keywords:
+                keywords = {**keywords, **kwargs}
+            else:
+                keywords = kwargs
+        return func(*self.args, *args, **keywords)
 
     def is_alive(self) -> bool:
-        try:
-            self.args
-        except RuntimeError:
+        # check the refs directly, rather than building self.args/self.func
+        for ref in self._live_arg_refs:
+            if ref() is None:
+                return False
+        for ref in self._live_kwarg_refs:
+            if ref() is None:
+                return False
+        if self._obj_ref() is None:
             return False
-        return super().is_alive() and self.func is not None
+        return self._self_ref is None or self._self_ref() is not None
+
+
+def run_emit(callers: list[WeakCallable], args: tuple[Any, ...] = ()) -> list[int]:
+    """Call `callback(args)` on each of `callers`.
+
+    Returns the (ascending) indices of callers whose referents have been deleted,
+    so that they can be removed afterwards with `prune_dead`, rather than
+    modifying `callers` during iteration.
+    """
+    dead: list[int] = []
+    dead_append = dead.append
+    for i, caller in enumerate(callers):
+        if caller.callback(args):
+            dead_append(i)
+    return dead
+
+
+def prune_dead(callers: list[WeakCallable], dead: list[int]) -> None:
+    """Remove the callers at (ascending) indices `dead`, as returned by `run_emit`."""
+    for i in reversed(dead):
+        del callers[i]
@@ -11,7 +11,7 @@ class WeakCallable(Generic[P, R]):
     """Weak reference to a callable."""
 
     _obj_ref: weakref.ReferenceType[Any]
-    _max_args: int | None = None
+    _max_args: int | None
 
     def callback(self, args: tuple[Any, ...] = ()) -> bool:
         """Call the referenced function. Return True if weakref is dead.
@@ -49,3 +49,9 @@ class _SetattrCaller(WeakCallable):
 
 class weak_partial(WeakCallable[P, R]):
     def __init__(self, func: Callable[P, R], *args: Any, **kwargs: Any) -> None: ...
+
+def run_emit(callers: list[WeakCallable], args: tuple[Any, ...] = ()) -> list[int]:
+    """Call `callback(args)` on each of `callers`, return indices of dead ones."""
+
+def prune_dead(callers: list[WeakCallable], dead: list[int]) -> None:
+    """Remove the callers at (ascending) indices `dead`, as returned by `run_emit`."""
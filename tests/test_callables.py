@@ -4,7 +4,7 @@ from typing import Any
 from unittest.mock import Mock
 
 import pytest
-from weak._callable import WeakCallable, weak_partial
+from weak._callable import WeakCallable, prune_dead, run_emit, weak_partial
 
 VAL = 42
 
@@ -129,3 +129,214 @@ def test_weak_partial() -> None:
         caller("x")
     with pytest.raises(RuntimeError):
         caller2("x")
+
+
+def test_callers_have_no_dict() -> None:
+    class Foo:
+        x: int = 0
+
+        def func(self, x: int) -> int:
+            return x
+
+        def __setitem__(self, key: str, value: int) -> None:
+            self.x = value
+
+    def func(x: int) -> int:
+        return x
+
+    foo = Foo()
+    callers = [
+        WeakCallable.create(func),
+        WeakCallable.create(foo.func),
+        WeakCallable.create([].append),
+        WeakCallable.create(partial(foo.func, 1)),
+        WeakCallable.create(foo.__setattr__, key="x"),
+        WeakCallable.create(foo.__setitem__, key="x"),
+        weak_partial(foo.func, 1),
+    ]
+    for caller in callers:
+        assert not hasattr(caller, "__dict__"), type(caller)
+
+
+def test_max_args() -> None:
+    mock = Mock()
+
+    class Foo:
+        x: Any = 0
+
+        def func(self, *args: Any) -> None:
+            mock(*args)
+
+        def __setitem__(self, key: str, value: Any) -> None:
+            self.x = value
+
+    foo = Foo()
+    assert WeakCallable.create(foo.func, max_args=1).callback((1, 2)) is False
+    mock.assert_called_once_with(1)
+
+    mock.reset_mock()
+    caller = WeakCallable.create(partial(foo.func, 0), max_args=1)
+    assert caller.callback((1, 2)) is False
+    mock.assert_called_once_with(0, 1)
+
+    mock.reset_mock()
+    WeakCallable.create(mock, max_args=2).callback((1, 2, 3))
+    mock.assert_called_once_with(1, 2)
+
+    WeakCallable.create(foo.__setattr__, max_args=1, key="x").callback((1, 2))
+    assert foo.x == 1
+    WeakCallable.create(foo.__setitem__, max_args=2, key="x").callback((1, 2, 3))
+    assert foo.x == (1, 2)
+
+
+def test_weak_partial_mixed_args() -> None:
+    class T:
+        ...
+
+    t = T()
+    lst = [1]  # not weakrefable, so it is held strongly
+    mock = Mock()
+    caller = weak_partial(mock, 1, t, lst, None, a=t, b="b", c=None)
+    assert caller.args == (1, t, lst, None)
+    assert caller.keywords == {"a": t, "b": "b", "c": None}
+
+    assert caller.callback(("x",)) is False
+    mock.assert_called_once_with(1, t, lst, None, "x", a=t, b="b", c=None)
+
+    mock.reset_mock()
+    caller("y", b="z")
+    mock.assert_called_once_with(1, t, lst, None, "y", a=t, b="z", c=None)
+
+    assert caller.is_alive()
+    mock.reset_mock()  # drop the references held in mock.call_args
+    del t
+    assert not caller.is_alive()
+    assert caller.callback(("x",)) is True
+
+    # dead keyword argument only
+    u = T()
+    caller = weak_partial(mock, 1, u=u)
+    assert caller.is_alive()
+    del u
+    assert not caller.is_alive()
+    assert caller.callback() is True
+
+
+def test_run_emit() -> None:
+    def func1(x: int) -> None:
+        results.append(("f1", x))
+
+    def func2(x: int) -> None:
+        results.append(("f2", x))
+
+    def func3(x: int) -> None:
+        results.append(("f3", x))
+
+    results: list = []
+    callers = [WeakCallable.create(f) for f in (func1, func2, func3)]
+    assert run_emit(callers, (1,)) == []
+    assert results == [("f1", 1), ("f2", 1), ("f3", 1)]
+
+    del func1, func3
+    results.clear()
+    dead = run_emit(callers, (2,))
+    assert dead == [0, 2]
+    assert results == [("f2", 2)]
+
+    prune_dead(callers, dead)
+    assert len(callers) == 1
+    assert run_emit(callers, (3,)) == []
+    assert results == [("f2", 2), ("f2", 3)]
+
+
+def test_weak_partial_not_callable() -> None:
+    with pytest.raises(TypeError, match="must be callable"):
+        weak_partial(1)  # type: ignore[arg-type]
+
+
+def test_callers_hashable() -> None:
+    class Foo:
+        x: int = 0
+
+        def func(self, x: int) -> int:
+            return x
+
+        def __setitem__(self, key: str, value: int) -> None:
+            self.x = value
+
+    def func(x: int) -> int:
+        return x
+
+    class S(set):
+        ...
+
+    foo = Foo()
+    s = S()
+    makers = [
+        lambda: WeakCallable.create(func),
+        lambda: WeakCallable.create(foo.func),
+        lambda: WeakCallable.create(s.add),
+        lambda: WeakCallable.create(partial(foo.func, 1)),
+        lambda: WeakCallable.create(foo.__setattr__, key="x"),
+        lambda: WeakCallable.create(foo.__setitem__, key="x"),
+    ]
+    callers = {make(): None for make in makers}
+    assert len(callers) == len(makers)
+    for make in makers:
+        caller = make()
+        assert caller in callers
+        del callers[caller]
+    assert not callers
+
+
+def test_non_weakrefable() -> None:
+    class NoRef:
+        __slots__ = ()
+
+        def __call__(self, x: int) -> None:
+            results.append(x)
+
+    results: list = []
+    func = NoRef()
+    for target in (func, results.append):
+        caller = WeakCallable.create(target)
+        assert caller.is_alive()
+        assert caller.slot() == target
+        assert caller.callback((1,)) is False
+        assert caller == WeakCallable.create(target)
+        assert len({caller, WeakCallable.create(target)}) == 1
+    assert results == [1, 1]
+    assert WeakCallable.create(func) != WeakCallable.create(NoRef())
+
+
+def test_equal_objects_distinct_callers() -> None:
+    class Foo:
+        def __eq__(self, other: object) -> bool:
+            return isinstance(other, Foo)
+
+        __hash__ = object.__hash__
+
+        def func(self, x: int) -> int:
+            return x
+
+    a, b = Foo(), Foo()
+    assert a == b
+    assert WeakCallable.create(a.func) == WeakCallable.create(a.func)
+    assert WeakCallable.create(a.func) != WeakCallable.create(b.func)
+    assert len({WeakCallable.create(a.func), WeakCallable.create(b.func)}) == 2
+
+
+def test_weak_partial_const_args() -> None:
+    mock = Mock()
+    caller = weak_partial(mock, 1, "a", k=2)
+    assert caller.args is caller.args
+    assert caller.args == (1, "a")
+    assert caller.keywords == {"k": 2}
+
+    assert caller.callback(("x",)) is False
+    mock.assert_called_once_with(1, "a", "x", k=2)
+    mock.reset_mock()
+    caller("y", k=3)
+    mock.assert_called_once_with(1, "a", "y", k=3)
+    # the stored keywords are not modified by call-time kwargs
+    assert caller.keywords == {"k": 2}